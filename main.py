@@ -1,10 +1,4 @@
 import streamlit as st
-from modules.sellerboard import sellerboard_page
-from modules.ppc_xnurta import ppc_xnurta_page
-from modules.dsp_xnurta import dsp_xnurta_page
-from modules.fba_inventory import fba_inventory_page
-from modules.asin import asin_dimension_page
-from modules.launching import launching_dimension_page
 from datetime import datetime
 import pytz
 import os
@@ -244,35 +238,42 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.caption("Version 1.0.0 | Updated Oct 2025")
     
-    # Route to appropriate page with enhanced messaging
+    # Route to appropriate page with enhanced messaging. Page modules are
+    # imported on first use so pandas/gspread/google-auth only load for the
+    # page that is actually opened, not before the first render.
     if page == "📊 Sellerboard":
         st.markdown("## 📊 Sellerboard Data Upload")
         st.markdown("*Manage your Sellerboard reports and analytics*")
         st.markdown("")
+        from modules.sellerboard import sellerboard_page
         sellerboard_page()
         
     elif page == "💰 PPC XNurta":
         st.markdown("## 💰 PPC XNurta Analytics")
         st.markdown("*Upload and analyze your PPC campaign data*")
         st.markdown("")
+        from modules.ppc_xnurta import ppc_xnurta_page
         ppc_xnurta_page()
         
     elif page == "📺 DSP XNurta":
         st.markdown("## 📺 DSP XNurta Dashboard")
         st.markdown("*Manage your DSP advertising data*")
         st.markdown("")
+        from modules.dsp_xnurta import dsp_xnurta_page
         dsp_xnurta_page()
         
     elif page == "📦 FBA Inventory":
         st.markdown("## 📦 FBA Inventory Management")
         st.markdown("*Manage your FBA Inventory reports and analytics*")
         st.markdown("")
+        from modules.fba_inventory import fba_inventory_page
         fba_inventory_page()
             
     elif page == "🔍 ASIN":
         st.markdown("## 🔍 ASIN Dimension Analysis")
         st.markdown("*Manage your Product reports and analytics*")
         st.markdown("")
+        from modules.asin import asin_dimension_page
         asin_dimension_page()
 
             
@@ -280,6 +281,7 @@ def main():
         st.markdown("## 🚀 Product Launch Analytics")
         st.markdown("*Manage your Product reports and analytics*")
         st.markdown("")
+        from modules.launching import launching_dimension_page
         launching_dimension_page()
     
     # Footer section
@@ -6,22 +6,9 @@ This package contains modules for different data analysis tools:
 - sellerboard: Sellerboard data analysis
 - ppc_xnurta: PPC Xnurta data analysis
 - dsp_xnurta: DSP Xnurta data analysis
-"""
-
-from .sellerboard import sellerboard_page
-from .ppc_xnurta import ppc_xnurta_page
-from .dsp_xnurta import dsp_xnurta_page
-from .fba_inventory import fba_inventory_page
-from .asin import asin_dimension_page
-from .launching import launching_dimension_page
 
-__all__ = [
-    'sellerboard_page',
-    'ppc_xnurta_page',
-    'dsp_xnurta_page'
-    'fba_inventory_page',
-    'asin_dimension_page',
-    'launching_dimension_page',
-]
+Page modules are not imported here; main.py imports each one when its
+page is selected.
+"""
 
-__version__ = '1.0.0'
\ No newline at end of file
+__version__ = '1.0.0'
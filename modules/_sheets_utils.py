@@ -0,0 +1,53 @@
+import hashlib
+import pandas as pd
+from datetime import datetime
+
+
+def format_sheet_dates(series: pd.Series) -> pd.Series:
+    """Format a datetime Series as M/D/YYYY strings, empty where missing"""
+    return (
+        series.dt.month.astype('Int64').astype(str) + '/' +
+        series.dt.day.astype('Int64').astype(str) + '/' +
+        series.dt.year.astype('Int64').astype(str)
+    ).where(series.notna(), "")
+
+
+def to_sheet_values(df, columns):
+    """Convert DataFrame rows into lists of JSON-safe cell values for Google Sheets"""
+    out = df[columns].copy()
+    for col in out.columns:
+        series = out[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            out[col] = format_sheet_dates(series)
+        elif pd.api.types.infer_dtype(series, skipna=True) not in (
+            'string', 'integer', 'floating', 'mixed-integer-float', 'empty'
+        ):
+            # Mixed object columns: format dates, stringify anything non-numeric
+            out[col] = series.map(
+                lambda val: f"{val.month}/{val.day}/{val.year}" if isinstance(val, (pd.Timestamp, datetime))
+                else val if isinstance(val, (float, int, str)) else str(val),
+                na_action='ignore'
+            )
+    out = out.astype(object)
+    return out.where(out.notna(), "").values.tolist()
+
+
+def data_completeness(df: pd.DataFrame) -> float:
+    """Percentage of non-empty cells in the DataFrame"""
+    if df.size == 0:
+        return 0.0
+    return 100.0 * int(df.count().sum()) / df.size
+
+
+def hash_dataframe(df: pd.DataFrame):
+    """Full-content hash so cached exports never reuse a stale frame
+    
+    Row hashes are digested in order, so reordered rows hash differently.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return (
+        tuple(df.columns),
+        tuple(map(str, df.dtypes)),
+        df.shape,
+        hashlib.sha256(row_hashes.tobytes()).hexdigest()
+    )
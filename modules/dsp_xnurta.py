@@ -1,15 +1,52 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import io
 import re
 import traceback
 import time
-from datetime import datetime
+from datetime import datetime, date
 from google.oauth2.service_account import Credentials
 import gspread
 import json
 import pytz
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from concurrent.futures import ThreadPoolExecutor
+from ._sheets_utils import format_sheet_dates, data_completeness, hash_dataframe
+
+# ============================================================
+# Google Sheets Connection
+# ============================================================
+@st.cache_resource(show_spinner=False, ttl=3600)
+def get_worksheet(creds_json_str: str, sheet_id: str, worksheet_name: str):
+    """Return an authorized worksheet handle, reused across Streamlit reruns
+    
+    Keyed on the serialized credentials so each service account gets its own
+    client. If the worksheet does not exist it is created with the DSP
+    header row. Handles expire after an hour, or sooner via
+    DSPProcessor._forget_worksheet.
+    """
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive"
+    ]
+    creds = Credentials.from_service_account_info(json.loads(creds_json_str), scopes=scopes)
+    client = gspread.authorize(creds)
+    spreadsheet = client.open_by_key(sheet_id)
+    
+    try:
+        worksheet = spreadsheet.worksheet(worksheet_name)
+    except gspread.exceptions.WorksheetNotFound:
+        worksheet = spreadsheet.add_worksheet(
+            title=worksheet_name, 
+            rows="2000", 
+            cols="50"
+        )
+        # Appends locate the table from A1, so new sheets get a header
+        worksheet.update(values=[list(DSPProcessor.REQUIRED_COLUMNS)], range_name="A1")
+    
+    return worksheet
+
 
 # ============================================================
 # DSP Processor Class
@@ -17,50 +54,79 @@ import pytz
 class DSPProcessor:
     """DSP XNurta Data Processor"""
     
+    # YYYYMMDD date embedded in uploaded filenames
+    DATE_PATTERN = re.compile(r"(\d{4})(\d{2})(\d{2})")
+    
+    # Output column order; columns missing from a file are added empty
+    REQUIRED_COLUMNS = (
+        "ASIN", "Creative", "Date", "Total cost", "Total product sales", "eCPM",
+        "Total CPDPV", "Total ROAS", "Total percent of purchases new-to-brand",
+        "CTR", "Total DPVR", "Total ATCR", "Total eCPP", "ROAS", "VCR",
+        "Impressions", "Click-throughs", "Total DPV", "Total ATC", "Total purchase",
+        "Total units sold", "Branded Searches", "eCPC", "DPV", "DPVR", "CPDPV",
+        "ATC", "ATCR", "Total CPATC", "CPATC", "Product sales",
+        "Total new-to-brand product sales", "New-to-brand product Sales",
+        "Total new-to-brand ROAS", "New-to-brand return on advertising spend",
+        "Purchases", "Total new-to-brand purchases", "New-to-brand purchases",
+        "Total Purchase Rate"
+    )
+    
     def __init__(self, credentials_dict: dict, sheet_id: str, worksheet_base_name: str = "Raw_DSP_H2_2025"):
         self.credentials_dict = credentials_dict
         self.sheet_id = sheet_id
         self.worksheet_base_name = worksheet_base_name
-        self.client = None
         self.spreadsheet = None
         self.worksheet = None
+        # Worksheets already bound by this processor, keyed by market
+        self._worksheets = {}
     
     def _init_google_sheets(self, market: str):
         """Initialize Google Sheets client and worksheet"""
         try:
-            if self.client is None:
-                scopes = [
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive"
-                ]
-                creds = Credentials.from_service_account_info(self.credentials_dict, scopes=scopes)
-                self.client = gspread.authorize(creds)
-                self.spreadsheet = self.client.open_by_key(self.sheet_id)
+            if market in self._worksheets:
+                self.worksheet = self._worksheets[market]
+                return True
             
             worksheet_name = f"{self.worksheet_base_name}_{market}"
             
-            try:
-                self.worksheet = self.spreadsheet.worksheet(worksheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                self.worksheet = self.spreadsheet.add_worksheet(
-                    title=worksheet_name, 
-                    rows="2000", 
-                    cols="50"
-                )
+            # Client, spreadsheet and worksheet lookups are cached per
+            # credentials/sheet/worksheet, so reruns skip the auth round trips
+            self.worksheet = get_worksheet(
+                json.dumps(self.credentials_dict, sort_keys=True),
+                self.sheet_id,
+                worksheet_name
+            )
+            self.spreadsheet = self.worksheet.spreadsheet
+            self._worksheets[market] = self.worksheet
             
             return True
             
         except Exception as e:
             raise Exception(f"Error initializing Google Sheets: {e}")
     
+    def _forget_worksheet(self, market: str):
+        """Drop the cached worksheet handle for a market
+        
+        Called when the Sheets API rejects a request, e.g. because the tab was
+        deleted or renamed since the handle was cached.
+        """
+        get_worksheet.clear(
+            json.dumps(self.credentials_dict, sort_keys=True),
+            self.sheet_id,
+            f"{self.worksheet_base_name}_{market}"
+        )
+        self._worksheets.pop(market, None)
+        self.worksheet = None
+    
     @staticmethod
     def extract_date_from_filename(filename: str):
         """Extract YYYYMMDD pattern from filename"""
-        match = re.search(r"(\d{8})", filename)
+        match = DSPProcessor.DATE_PATTERN.search(filename)
         if match:
+            year, month, day = match.groups()
             try:
-                return datetime.strptime(match.group(1), "%Y%m%d").date()
-            except Exception:
+                return date(int(year), int(month), int(day))
+            except ValueError:
                 return None
         return None
     
@@ -68,7 +134,11 @@ class DSPProcessor:
     def process_single_file_content(file_content: bytes, filename: str) -> pd.DataFrame:
         """Process a single Excel file"""
         try:
-            df = pd.read_excel(io.BytesIO(file_content))
+            # Prefer the Rust-backed calamine engine, fall back to pandas' default
+            try:
+                df = pd.read_excel(io.BytesIO(file_content), engine="calamine")
+            except ImportError:
+                df = pd.read_excel(io.BytesIO(file_content))
         except Exception as e:
             raise ValueError(f"Failed to read Excel {filename}: {e}")
         
@@ -79,85 +149,78 @@ class DSPProcessor:
         if "Creative Asset" in df.columns:
             df = df.drop(columns=["Creative Asset"])
         
-        # Drop last row (totals)
-        if len(df) > 1:
-            df = df.iloc[:-1, :].copy()
-        else:
-            df = df.copy()
-        
         # Ensure 'Creative' column exists
         if "Creative" not in df.columns:
             raise ValueError(f"'Creative' column not found in {filename}")
         
-        # Create ASIN column
-        df.insert(0, "ASIN", df["Creative"].astype(str).str[:10].str.upper())
+        # Arrow-backed strings keep Creative in one contiguous buffer and
+        # let the ASIN slice/upper below run as Arrow compute kernels
+        df["Creative"] = df["Creative"].astype("string[pyarrow]")
+        
+        # Drop last row (totals). Later steps only add whole columns, which
+        # never write back into the parent, so the slice needs no copy
+        if len(df) > 1:
+            df = df.iloc[:-1]
+        
+        # Create ASIN column (string[pyarrow], like Creative)
+        df.insert(0, "ASIN", df["Creative"].str[:10].str.upper())
         
         # Extract date
         file_date = DSPProcessor.extract_date_from_filename(filename)
         date_val = pd.to_datetime(file_date) if file_date else pd.NaT
         
-        # Insert Date column after Creative
-        try:
-            creative_idx = list(df.columns).index("Creative")
-            before = df.iloc[:, :creative_idx + 1].copy()
-            after = df.iloc[:, creative_idx + 1:].copy()
-            date_series = pd.Series([date_val] * len(df), name="Date", index=df.index)
-            df = pd.concat([before, date_series, after], axis=1)
-        except Exception:
+        # The filename date replaces a Date column already in the file;
+        # otherwise it is inserted after Creative
+        if "Date" in df.columns:
             df["Date"] = date_val
+        else:
+            df.insert(df.columns.get_loc("Creative") + 1, "Date", date_val)
         
-        # Define required columns
-        required_columns = [
-            "ASIN", "Creative", "Date", "Total cost", "Total product sales", "eCPM",
-            "Total CPDPV", "Total ROAS", "Total percent of purchases new-to-brand",
-            "CTR", "Total DPVR", "Total ATCR", "Total eCPP", "ROAS", "VCR",
-            "Impressions", "Click-throughs", "Total DPV", "Total ATC", "Total purchase",
-            "Total units sold", "Branded Searches", "eCPC", "DPV", "DPVR", "CPDPV",
-            "ATC", "ATCR", "Total CPATC", "CPATC", "Product sales",
-            "Total new-to-brand product sales", "New-to-brand product Sales",
-            "Total new-to-brand ROAS", "New-to-brand return on advertising spend",
-            "Purchases", "Total new-to-brand purchases", "New-to-brand purchases",
-            "Total Purchase Rate"
-        ]
-        
-        # Add missing columns
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = np.nan
-        
-        # Reorder columns
-        df = df.loc[:, required_columns]
+        # Select, order and add missing columns in a single pass
+        df = df.reindex(columns=DSPProcessor.REQUIRED_COLUMNS)
         
         return df
     
     def process_files(self, uploaded_files: list) -> tuple:
-        """Process multiple uploaded files"""
+        """Process multiple uploaded files with parallel processing"""
         all_dfs = []
         processed_files = []
         
-        for uploaded_file in uploaded_files:
-            try:
-                content = uploaded_file.read()
-                df = self.process_single_file_content(content, uploaded_file.name)
-                all_dfs.append(df)
-                processed_files.append({
-                    'file_name': uploaded_file.name,
-                    'rows_count': len(df)
-                })
-            except Exception as e:
-                st.error(f"⚠️ Error processing {uploaded_file.name}: {e}")
+        if not uploaded_files:
+            return pd.DataFrame(), []
+        
+        # Parse files in parallel. Contents are read on the main thread since
+        # UploadedFile is not thread-safe, and errors are reported here after
+        # each worker finishes so st.error always runs in the script thread.
+        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+            future_to_file = {
+                executor.submit(
+                    _process_file_cached,
+                    uploaded_file.getvalue(),
+                    uploaded_file.name
+                ): uploaded_file.name
+                for uploaded_file in uploaded_files
+            }
+            
+            # Collect in upload order so the merged output is stable
+            for future, filename in future_to_file.items():
+                try:
+                    df = future.result()
+                    all_dfs.append(df)
+                    processed_files.append({
+                        'file_name': filename,
+                        'rows_count': len(df)
+                    })
+                except Exception as e:
+                    st.error(f"⚠️ Error processing {filename}: {e}")
         
         if not all_dfs:
             return pd.DataFrame(), []
         
+        # Every frame already has the required column order (ASIN, Creative,
+        # Date first), so a single concat is all that is needed
         merged_df = pd.concat(all_dfs, ignore_index=True, sort=False)
         
-        # Reorder columns
-        cols = list(merged_df.columns)
-        desired_front = ["ASIN", "Creative", "Date"]
-        new_cols = [c for c in desired_front if c in cols] + [c for c in cols if c not in desired_front]
-        merged_df = merged_df.loc[:, new_cols]
-        
         return merged_df, processed_files
     
     def append_to_sheets(self, df: pd.DataFrame, market: str) -> bool:
@@ -170,41 +233,32 @@ class DSPProcessor:
             return False
         
         try:
-            safe_df = df.copy()
-            
-            # Format datetime columns
-            datetime_cols = safe_df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).columns
+            # Format datetime columns as M/D/YYYY column-wise instead of per cell.
+            # assign() swaps in just these columns, so the frame is not copied.
+            datetime_cols = df.select_dtypes(include=["datetime64", "datetimetz"]).columns
+            formatted_dates = {}
             for col in datetime_cols:
-                safe_df[col] = safe_df[col].apply(lambda x: f"{x.month}/{x.day}/{x.year}" if pd.notna(x) else "")
-            
-            safe_df = safe_df.fillna("")
-            values_to_append = safe_df.values.tolist()
-            
-            # Calculate rows needed
-            existing_vals = self.worksheet.get_all_values()
-            existing_rows = len(existing_vals)
-            start_row = max(existing_rows + 1, 2)
-            end_row = start_row + len(values_to_append) - 1
+                formatted_dates[col] = format_sheet_dates(df[col])
             
-            current_rows = self.worksheet.row_count
-            if end_row > current_rows:
-                add_count = end_row - current_rows
-                self.worksheet.add_rows(add_count)
+            values_to_append = df.assign(**formatted_dates).fillna("").values.tolist()
             
-            # Calculate range
-            end_col_index = safe_df.shape[1]
-            end_col_letter = gspread.utils.rowcol_to_a1(1, end_col_index).split('1')[0]
-            range_name = f"A{start_row}:{end_col_letter}{end_row}"
+            # Append in fixed-size chunks; the Sheets API locates the end of
+            # the table server-side, so no row count has to be fetched first
+            chunk_size = 5000  # Google Sheets API limit
             
-            # Upload data
-            self.worksheet.update(
-                values=values_to_append, 
-                range_name=range_name, 
-                value_input_option="USER_ENTERED"
-            )
+            for i in range(0, len(values_to_append), chunk_size):
+                self.worksheet.append_rows(
+                    values_to_append[i:i + chunk_size],
+                    value_input_option="USER_ENTERED",
+                    insert_data_option="INSERT_ROWS",
+                    table_range="A1"
+                )
             
             return True
             
+        except gspread.exceptions.APIError as e:
+            self._forget_worksheet(market)
+            raise Exception(f"Error uploading to Google Sheets: {e}")
         except Exception as e:
             raise Exception(f"Error uploading to Google Sheets: {e}")
 
@@ -212,28 +266,174 @@ class DSPProcessor:
 # ============================================================
 # Helper Functions
 # ============================================================
-def export_to_excel_bytes(df: pd.DataFrame, market: str):
-    """Export DataFrame to Excel bytes"""
+@st.cache_data(show_spinner=False, max_entries=128, ttl=3600)
+def _process_file_cached(file_bytes: bytes, filename: str) -> pd.DataFrame:
+    """Cached DSPProcessor.process_single_file_content keyed on the uploaded file bytes"""
+    return DSPProcessor.process_single_file_content(file_bytes, filename)
+
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: hash_dataframe})
+def export_to_excel_bytes(df: pd.DataFrame, market: str) -> bytes:
+    """Export DataFrame to Excel bytes, cached across reruns"""
     out = io.BytesIO()
-    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+    with pd.ExcelWriter(
+        out,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"strings_to_formulas": False, "strings_to_urls": False}}
+    ) as writer:
         df.to_excel(writer, index=False, sheet_name=f"DSP_{market}")
-    out.seek(0)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"DSP_{market}_{timestamp}.xlsx"
-    return out, filename
+    return out.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: hash_dataframe})
+def export_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Export DataFrame to UTF-8 CSV bytes, cached across reruns"""
+    # Date-only datetime columns are written as plain dates, as pandas does
+    date_only = {
+        col: df[col].dt.date
+        for col in df.select_dtypes(include=["datetime64", "datetimetz"]).columns
+        if df[col].dt.normalize().equals(df[col])
+    }
+    try:
+        # pyarrow's multi-threaded C++ writer is several times faster than to_csv
+        table = pa.Table.from_pandas(df.assign(**date_only), preserve_index=False)
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(table, sink)
+        return sink.getvalue().to_pybytes()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns have no Arrow type; let pandas handle them
+        return df.to_csv(index=False).encode('utf-8')
 
 
 def json_load_stream(uploaded_file):
     """Load JSON from uploaded file"""
-    try:
-        uploaded_file.seek(0)
-        j = json.load(uploaded_file)
-        return j
-    finally:
-        try:
-            uploaded_file.seek(0)
-        except Exception:
-            pass
+    # getvalue() ignores the stream position, so no seek bookkeeping is needed
+    return json.loads(uploaded_file.getvalue())
+
+
+@st.fragment
+def _render_preview(result_df: pd.DataFrame):
+    """Data preview; its widgets only rerun this fragment"""
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        preview_rows = st.slider(
+            "Preview rows",
+            min_value=5,
+            max_value=min(50, len(result_df)),
+            value=10,
+            step=5,
+            key="dsp_preview_slider"
+        )
+    with col2:
+        show_all = st.checkbox("All columns", value=False, key="dsp_show_all")
+
+    display_df = result_df if show_all else (result_df.iloc[:, :8] if len(result_df.columns) > 8 else result_df)
+    st.dataframe(display_df.head(preview_rows), use_container_width=True, height=300)
+
+    if not show_all and len(result_df.columns) > 8:
+        st.caption(f"Showing 8 of {len(result_df.columns)} columns. Enable 'All columns' to see more.")
+
+
+@st.fragment
+def _render_export_and_upload(result_df: pd.DataFrame, processed_files: list, selected_market: str):
+    """Download and Google Sheets upload section; its widgets only rerun this fragment"""
+    st.markdown("### 📤 Export Options")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 📥 Download Locally")
+
+        # The workbook is cached; only the timestamped name is rebuilt
+        excel_data = export_to_excel_bytes(result_df, selected_market)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"DSP_{selected_market}_{timestamp}.xlsx"
+        st.download_button(
+            label="💾 Download Excel",
+            data=excel_data,
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True,
+            key="dsp_download_excel"
+        )
+
+        csv = export_to_csv_bytes(result_df)
+        csv_filename = filename.replace('.xlsx', '.csv')
+        st.download_button(
+            label="📄 Download CSV",
+            data=csv,
+            file_name=csv_filename,
+            mime="text/csv",
+            use_container_width=True,
+            key="dsp_download_csv"
+        )
+
+    with col2:
+        st.markdown("#### ☁️ Upload to Cloud")
+        st.info(f"**Target:** {selected_market} market sheet\n\n**Rows:** {len(result_df):,}")
+
+        # --- NEW FEATURE: Optional Delete by Date ---
+        with st.expander("🧹 Optional: Delete existing data from date"):
+            delete_date = st.date_input(
+                "Select start date to delete existing data from this date onward (optional)",
+                value=None,
+                key="dsp_delete_date"
+            )
+            if delete_date:
+                st.warning(f"⚠️ Existing data from **{delete_date.strftime('%Y-%m-%d')}** onward will be deleted before upload.")
+
+        if st.button(
+            "🚀 Push to Google Sheets",
+            type="primary",
+            use_container_width=True,
+            key="dsp_push_to_sheets_btn"
+        ):
+            try:
+                processor = st.session_state.dsp_processor
+                with st.spinner("Uploading to Google Sheets..."):
+                    # If delete_date selected → delete data first
+                    if delete_date:
+                        st.info(f"🧹 Deleting existing data from {delete_date.strftime('%Y-%m-%d')} onward...")
+                        processor._init_google_sheets(selected_market)
+                        existing_df = pd.DataFrame(processor.worksheet.get_all_records())
+
+                        if not existing_df.empty and "Date" in existing_df.columns:
+                            existing_df["Date"] = pd.to_datetime(existing_df["Date"], errors="coerce")
+                            keep_df = existing_df[existing_df["Date"] < pd.to_datetime(delete_date)]
+
+                            # Clear old data
+                            processor.worksheet.clear()
+                            processor.worksheet.update(
+                                [list(keep_df.columns)] + keep_df.astype(str).fillna("").values.tolist(),
+                                value_input_option="USER_ENTERED"
+                            )
+                            st.success(f"✅ Deleted and kept {len(keep_df):,} older rows.")
+                        else:
+                            st.warning("⚠️ No existing data found or no valid 'Date' column — skipping delete step.")
+
+                    # --- Push new data ---
+                    success = processor.append_to_sheets(result_df, selected_market)
+
+                if success:
+                    st.success(f"✅ Successfully uploaded {len(result_df):,} rows!")
+                    with st.expander("📊 Upload Summary", expanded=True):
+                        st.markdown(f"""
+                        - **Market:** {selected_market}
+                        - **Rows uploaded:** {len(result_df):,}
+                        - **Columns:** {len(result_df.columns)}
+                        - **Files processed:** {len(processed_files)}
+                        - **Delete from date:** {delete_date.strftime('%Y-%m-%d') if delete_date else 'Not applied'}
+                        - **Timestamp:** {datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime('%Y-%m-%d %H:%M:%S')}
+                        """)
+                else:
+                    st.error("❌ Upload failed")
+
+            except Exception as e:
+                        if isinstance(e, gspread.exceptions.APIError):
+                            st.session_state.dsp_processor._forget_worksheet(selected_market)
+                        st.error(f"❌ Upload failed: {str(e)}")
+                        with st.expander("🔍 Error Details"):
+                            st.code(traceback.format_exc())       
 
 
 # ============================================================
@@ -353,6 +553,7 @@ def dsp_xnurta_page():
                     result_df, processed_files = processor.process_files(uploaded_files)
                     
                     st.session_state.dsp_result_df = result_df
+                    st.session_state.dsp_result_completeness = data_completeness(result_df)
                     st.session_state.dsp_processor = processor
                     st.session_state.dsp_processed_files = processed_files
                     st.session_state.dsp_last_processed_files = current_file_names
@@ -364,7 +565,7 @@ def dsp_xnurta_page():
                         
                 except Exception as e:
                     st.error(f"❌ Error processing files: {str(e)}")
-                    for key in ['dsp_result_df', 'dsp_processor', 'dsp_processed_files', 'dsp_last_processed_files']:
+                    for key in ['dsp_result_df', 'dsp_result_completeness', 'dsp_processor', 'dsp_processed_files', 'dsp_last_processed_files']:
                         if key in st.session_state:
                             del st.session_state[key]
         
@@ -382,123 +583,19 @@ def dsp_xnurta_page():
             with col3:
                 st.metric("📁 Files", len(processed_files))
             with col4:
-                completeness = (1 - result_df.isnull().sum().sum() / (len(result_df) * len(result_df.columns))) * 100
+                # Computed once when the frame is stored, not on every rerun
+                completeness = st.session_state.get('dsp_result_completeness')
+                if completeness is None:
+                    completeness = data_completeness(result_df)
+                    st.session_state.dsp_result_completeness = completeness
                 st.metric("✓ Completeness", f"{completeness:.1f}%")
             
-            # Preview
-            col1, col2, col3 = st.columns([2, 1, 1])
-            with col1:
-                preview_rows = st.slider(
-                    "Preview rows",
-                    min_value=5,
-                    max_value=min(50, len(result_df)),
-                    value=10,
-                    step=5,
-                    key="dsp_preview_slider"
-                )
-            with col2:
-                show_all = st.checkbox("All columns", value=False, key="dsp_show_all")
-            
-            display_df = result_df if show_all else (result_df.iloc[:, :8] if len(result_df.columns) > 8 else result_df)
-            st.dataframe(display_df.head(preview_rows), use_container_width=True, height=300)
-            
-            if not show_all and len(result_df.columns) > 8:
-                st.caption(f"Showing 8 of {len(result_df.columns)} columns. Enable 'All columns' to see more.")
+            # Preview controls rerun only this fragment, not the whole page
+            _render_preview(result_df)
             
             st.markdown("---")
             
-            st.markdown("### 📤 Export Options")
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("#### 📥 Download Locally")
-
-                excel_data, filename = export_to_excel_bytes(result_df, selected_market)
-                st.download_button(
-                    label="💾 Download Excel",
-                    data=excel_data,
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True,
-                    key="dsp_download_excel"
-                )
-
-                csv = result_df.to_csv(index=False).encode('utf-8')
-                csv_filename = filename.replace('.xlsx', '.csv')
-                st.download_button(
-                    label="📄 Download CSV",
-                    data=csv,
-                    file_name=csv_filename,
-                    mime="text/csv",
-                    use_container_width=True,
-                    key="dsp_download_csv"
-                )
-
-            with col2:
-                st.markdown("#### ☁️ Upload to Cloud")
-                st.info(f"**Target:** {selected_market} market sheet\n\n**Rows:** {len(result_df):,}")
-
-                # --- NEW FEATURE: Optional Delete by Date ---
-                with st.expander("🧹 Optional: Delete existing data from date"):
-                    delete_date = st.date_input(
-                        "Select start date to delete existing data from this date onward (optional)",
-                        value=None,
-                        key="dsp_delete_date"
-                    )
-                    if delete_date:
-                        st.warning(f"⚠️ Existing data from **{delete_date.strftime('%Y-%m-%d')}** onward will be deleted before upload.")
-
-                if st.button(
-                    "🚀 Push to Google Sheets",
-                    type="primary",
-                    use_container_width=True,
-                    key="dsp_push_to_sheets_btn"
-                ):
-                    try:
-                        processor = st.session_state.dsp_processor
-                        with st.spinner("Uploading to Google Sheets..."):
-                            # If delete_date selected → delete data first
-                            if delete_date:
-                                st.info(f"🧹 Deleting existing data from {delete_date.strftime('%Y-%m-%d')} onward...")
-                                processor._init_google_sheets(selected_market)
-                                existing_df = pd.DataFrame(processor.worksheet.get_all_records())
-
-                                if not existing_df.empty and "Date" in existing_df.columns:
-                                    existing_df["Date"] = pd.to_datetime(existing_df["Date"], errors="coerce")
-                                    keep_df = existing_df[existing_df["Date"] < pd.to_datetime(delete_date)]
-                                    
-                                    # Clear old data
-                                    processor.worksheet.clear()
-                                    processor.worksheet.update(
-                                        [list(keep_df.columns)] + keep_df.astype(str).fillna("").values.tolist(),
-                                        value_input_option="USER_ENTERED"
-                                    )
-                                    st.success(f"✅ Deleted and kept {len(keep_df):,} older rows.")
-                                else:
-                                    st.warning("⚠️ No existing data found or no valid 'Date' column — skipping delete step.")
-
-                            # --- Push new data ---
-                            success = processor.append_to_sheets(result_df, selected_market)
-
-                        if success:
-                            st.success(f"✅ Successfully uploaded {len(result_df):,} rows!")
-                            with st.expander("📊 Upload Summary", expanded=True):
-                                st.markdown(f"""
-                                - **Market:** {selected_market}
-                                - **Rows uploaded:** {len(result_df):,}
-                                - **Columns:** {len(result_df.columns)}
-                                - **Files processed:** {len(processed_files)}
-                                - **Delete from date:** {delete_date.strftime('%Y-%m-%d') if delete_date else 'Not applied'}
-                                - **Timestamp:** {datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime('%Y-%m-%d %H:%M:%S')}
-                                """)
-                        else:
-                            st.error("❌ Upload failed")
-
-                    except Exception as e:
-                                st.error(f"❌ Upload failed: {str(e)}")
-                                with st.expander("🔍 Error Details"):
-                                    st.code(traceback.format_exc())       
+            _render_export_and_upload(result_df, processed_files, selected_market)
     
     else:
         st.info("👆 **Upload Excel files to get started**")
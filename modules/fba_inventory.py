@@ -7,6 +7,7 @@ import io
 from datetime import datetime
 import pytz
 import traceback
+from ._sheets_utils import to_sheet_values
 
 class FBAInventoryProcessor:
     """FBA Inventory Data Processor"""
@@ -53,7 +54,11 @@ class FBAInventoryProcessor:
         try:
             # Try different file formats
             if filename.endswith('.xlsx') or filename.endswith('.xls'):
-                df = pd.read_excel(io.BytesIO(file_content))
+                # Prefer the Rust-backed calamine engine, fall back to pandas' default
+                try:
+                    df = pd.read_excel(io.BytesIO(file_content), engine='calamine')
+                except ImportError:
+                    df = pd.read_excel(io.BytesIO(file_content))
             elif filename.endswith('.csv'):
                 # Try different encodings for CSV
                 try:
@@ -75,7 +80,7 @@ class FBAInventoryProcessor:
             else:
                 raise ValueError(f"Unsupported file format: {filename}")
             
-            df = df.dropna(axis=1, how="all").copy()
+            df = df.dropna(axis=1, how="all")
             
             # Add Last Updated timestamp
             df["Last Updated"] = datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime('%Y-%m-%d %H:%M:%S')
@@ -103,27 +108,13 @@ class FBAInventoryProcessor:
             self.worksheet.update(values=[columns], range_name='A1')
             
             # Prepare data
-            values_to_append = []
-            for _, row in df.iterrows():
-                row_values = []
-                for col in columns:
-                    val = row[col]
-                    if pd.isna(val):
-                        row_values.append("")
-                    elif isinstance(val, (pd.Timestamp, datetime)):
-                        row_values.append(f"{val.month}/{val.day}/{val.year}")
-                    elif isinstance(val, (float, int)):
-                        row_values.append(val)
-                    else:
-                        row_values.append(str(val))
-                values_to_append.append(row_values)
+            values_to_append = to_sheet_values(df, columns)
             
             # Upload data starting from row 2
             if values_to_append:
                 end_row = len(values_to_append) + 1
                 end_col_index = len(columns)
-                end_col_letter = gspread.utils.rowcol_to_a1(1, end_col_index).split('1')[0].strip()
-                range_name = f"A2:{end_col_letter}{end_row}"
+                range_name = f"A2:{gspread.utils.rowcol_to_a1(end_row, end_col_index)}"
                 
                 self.worksheet.update(
                     values=values_to_append,
@@ -137,10 +128,11 @@ class FBAInventoryProcessor:
             raise Exception(f"Error uploading to Google Sheets: {e}")
 
 
+
 def load_credentials_from_file(uploaded_file):
     """Load Google Sheets credentials from uploaded JSON file"""
     try:
-        credentials_dict = json.load(uploaded_file)
+        credentials_dict = json.loads(uploaded_file.getvalue())
         
         required_fields = ['type', 'project_id', 'private_key', 'client_email']
         for field in required_fields:
@@ -236,7 +228,7 @@ def fba_inventory_page():
                     with st.spinner(f"Processing {market}..."):
                         try:
                             processor = FBAInventoryProcessor(credentials_dict, sheet_id, market)
-                            file_content = uploaded_file.read()
+                            file_content = uploaded_file.getvalue()
                             df = processor.process_single_file(file_content, uploaded_file.name)
                             
                             if not df.empty:
@@ -346,7 +338,11 @@ def fba_inventory_page():
                 
                 # Excel download
                 output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                with pd.ExcelWriter(
+                    output,
+                    engine='xlsxwriter',
+                    engine_kwargs={'options': {'strings_to_formulas': False, 'strings_to_urls': False}}
+                ) as writer:
                     df.to_excel(writer, index=False, sheet_name='FBA_Inventory')
                 output.seek(0)
                 
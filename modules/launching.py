@@ -7,10 +7,17 @@ import io
 from datetime import datetime
 import pytz
 import traceback
+from ._sheets_utils import to_sheet_values
 
 class LaunchingProcessor:
     """Launching Data Processor"""
     
+    # Keywords used to match header variations of these standard columns
+    COLUMN_ALIASES = {
+        'Parent items': ('parent', 'item'),
+        'ASIN (Item)': ('asin', 'item'),
+    }
+    
     def __init__(self, credentials_dict, sheet_id):
         self.credentials_dict = credentials_dict
         self.sheet_id = sheet_id
@@ -56,47 +63,42 @@ class LaunchingProcessor:
     
     def _standardize_columns(self, df):
         """Standardize and map columns to standard column order"""
-        df = df.copy()
-        df.columns = [str(c).strip() for c in df.columns]
+        df = df.set_axis([str(c).strip() for c in df.columns], axis=1)
+        
+        # Create mapping from uploaded columns to standard columns:
+        # exact (case-insensitive) match first, keyword aliases only on a miss
+        df_col_map = {col.lower(): col for col in reversed(df.columns)}
         
-        # Create mapping from uploaded columns to standard columns
         column_mapping = {}
         for std_col in self.standard_columns:
-            std_col_lower = std_col.lower()
-            for df_col in df.columns:
-                df_col_lower = df_col.lower()
-                
-                # Exact match
-                if std_col_lower == df_col_lower:
-                    column_mapping[df_col] = std_col
-                    break
-                # Handle common variations
-                elif 'parent' in std_col_lower and 'item' in std_col_lower and 'parent' in df_col_lower and 'item' in df_col_lower:
-                    column_mapping[df_col] = std_col
-                    break
-                elif 'asin' in std_col_lower and 'item' in std_col_lower and 'asin' in df_col_lower and 'item' in df_col_lower:
-                    column_mapping[df_col] = std_col
-                    break
+            df_col = df_col_map.get(std_col.lower())
+            if df_col is None and std_col in self.COLUMN_ALIASES:
+                keywords = self.COLUMN_ALIASES[std_col]
+                df_col = next(
+                    (col for col in df.columns if all(k in col.lower() for k in keywords)),
+                    None
+                )
+            if df_col is not None:
+                column_mapping[df_col] = std_col
         
         # Rename columns based on mapping
         df = df.rename(columns=column_mapping)
+        if df.columns.has_duplicates:
+            df = df.loc[:, ~df.columns.duplicated()]
         
-        # Create result dataframe with standard columns
-        result_df = pd.DataFrame()
-        for col in self.standard_columns:
-            if col in df.columns:
-                result_df[col] = df[col]
-            else:
-                result_df[col] = pd.NA
-        
-        return result_df
+        # Select, order and add missing standard columns in a single pass
+        return df.reindex(columns=self.standard_columns)
     
     def process_single_file(self, file_content, filename):
         """Process a single file and return DataFrame"""
         try:
             # Try different file formats
             if filename.endswith('.xlsx') or filename.endswith('.xls'):
-                df = pd.read_excel(io.BytesIO(file_content))
+                # Prefer the Rust-backed calamine engine, fall back to pandas' default
+                try:
+                    df = pd.read_excel(io.BytesIO(file_content), engine='calamine')
+                except ImportError:
+                    df = pd.read_excel(io.BytesIO(file_content))
             elif filename.endswith('.csv'):
                 # Try different encodings for CSV
                 try:
@@ -118,7 +120,9 @@ class LaunchingProcessor:
             else:
                 raise ValueError(f"Unsupported file format: {filename}")
             
-            df = df.dropna(axis=1, how="all").copy()
+            # Drop all-empty columns first so a blank column named exactly like
+            # a standard column cannot shadow a filled alias column
+            df = df.dropna(axis=1, how="all")
             
             # Standardize columns to A-P format
             df = self._standardize_columns(df)
@@ -136,38 +140,29 @@ class LaunchingProcessor:
         try:
             self._init_google_sheets()
             
-            # Clear only columns A to P (16 columns)
-            # Get current row count to clear all data in these columns
-            all_values = self.worksheet.get_all_values()
-            total_rows = len(all_values) if all_values else 1000
+            # Clear only the standard columns (A to P for 16 columns)
+            # Clear every allocated grid row; row_count comes from the worksheet
+            # metadata already loaded, so no sheet values are downloaded
+            total_rows = self.worksheet.row_count
+            end_col_index = len(self.standard_columns)
             
             # Clear range A1:P{total_rows}
-            clear_range = f"A1:P{total_rows}"
+            clear_range = f"A1:{gspread.utils.rowcol_to_a1(total_rows, end_col_index)}"
             self.worksheet.batch_clear([clear_range])
             
             # Update header (A1:P1)
-            self.worksheet.update(values=[self.standard_columns], range_name='A1:P1')
+            self.worksheet.update(
+                values=[self.standard_columns],
+                range_name=f"A1:{gspread.utils.rowcol_to_a1(1, end_col_index)}"
+            )
             
             # Prepare data
-            values_to_append = []
-            for _, row in df.iterrows():
-                row_values = []
-                for col in self.standard_columns:
-                    val = row[col]
-                    if pd.isna(val):
-                        row_values.append("")
-                    elif isinstance(val, (pd.Timestamp, datetime)):
-                        row_values.append(f"{val.month}/{val.day}/{val.year}")
-                    elif isinstance(val, (float, int)):
-                        row_values.append(val)
-                    else:
-                        row_values.append(str(val))
-                values_to_append.append(row_values)
+            values_to_append = to_sheet_values(df, self.standard_columns)
             
             # Upload data starting from row 2 (A2:P{end_row})
             if values_to_append:
                 end_row = len(values_to_append) + 1
-                range_name = f"A2:P{end_row}"
+                range_name = f"A2:{gspread.utils.rowcol_to_a1(end_row, end_col_index)}"
                 
                 self.worksheet.update(
                     values=values_to_append,
@@ -181,10 +176,11 @@ class LaunchingProcessor:
             raise Exception(f"Error uploading to Google Sheets: {e}")
 
 
+
 def load_credentials_from_file(uploaded_file):
     """Load Google Sheets credentials from uploaded JSON file"""
     try:
-        credentials_dict = json.load(uploaded_file)
+        credentials_dict = json.loads(uploaded_file.getvalue())
         
         required_fields = ['type', 'project_id', 'private_key', 'client_email']
         for field in required_fields:
@@ -265,7 +261,7 @@ def launching_dimension_page():
             with st.spinner("⚙️ Processing file..."):
                 try:
                     processor = LaunchingProcessor(credentials_dict, sheet_id)
-                    file_content = uploaded_file.read()
+                    file_content = uploaded_file.getvalue()
                     df = processor.process_single_file(file_content, uploaded_file.name)
                     
                     if not df.empty:
@@ -362,7 +358,11 @@ def launching_dimension_page():
                 
                 # Excel download
                 output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                with pd.ExcelWriter(
+                    output,
+                    engine='xlsxwriter',
+                    engine_kwargs={'options': {'strings_to_formulas': False, 'strings_to_urls': False}}
+                ) as writer:
                     df.to_excel(writer, index=False, sheet_name='Launching')
                 output.seek(0)
                 
@@ -11,6 +11,7 @@ import traceback
 import warnings
 import time
 import pytz
+from ._sheets_utils import format_sheet_dates
 
 # Suppress warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
@@ -83,15 +84,6 @@ class PPCProcessor:
         except Exception as e:
             return portfolio_str
 
-    def get_existing_sheet_data_count(self):
-        """Get current number of rows in the sheet"""
-        try:
-            all_values = self.worksheet.col_values(1)
-            data_rows = len([val for val in all_values if val.strip()]) - 1 if all_values else 0
-            return data_rows
-        except Exception as e:
-            return 0
-    
     def append_to_sheets(self, df):
         """Append DataFrame to Google Sheets"""
         if df.empty:
@@ -99,33 +91,28 @@ class PPCProcessor:
         
         try:
             self._init_google_sheets()
-            existing_rows = self.get_existing_sheet_data_count()
-            start_row = max(existing_rows + 2, 2)
             
             safe_df = df.copy()
             
-            datetime_cols = safe_df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).columns
+            # Format datetime columns as M/D/YYYY column-wise instead of per cell
+            datetime_cols = safe_df.select_dtypes(include=["datetime64", "datetimetz"]).columns
             for col in datetime_cols:
-                safe_df[col] = safe_df[col].apply(lambda x: f"{x.month}/{x.day}/{x.year}" if pd.notna(x) else "")
+                safe_df[col] = format_sheet_dates(safe_df[col])
             
             safe_df = safe_df.fillna("")
             values_to_append = safe_df.values.tolist()
             
-            needed_rows = start_row + len(values_to_append) - 1
-            if needed_rows > self.worksheet.row_count:
-                add_count = needed_rows - self.worksheet.row_count
-                self.worksheet.add_rows(add_count)
+            # Append in fixed-size chunks; the Sheets API locates the end of
+            # the table server-side, so no row count has to be fetched first
+            chunk_size = 5000  # Google Sheets API limit
             
-            end_col_index = len(self.required_columns)
-            end_col_letter = gspread.utils.rowcol_to_a1(1, end_col_index).split('1')[0].strip()
-            end_row = start_row + len(df) - 1
-            range_name = f"A{start_row}:{end_col_letter}{end_row}"
-            
-            self.worksheet.update(
-                values=values_to_append, 
-                range_name=range_name,
-                value_input_option='USER_ENTERED'
-            )
+            for i in range(0, len(values_to_append), chunk_size):
+                self.worksheet.append_rows(
+                    values_to_append[i:i + chunk_size],
+                    value_input_option='USER_ENTERED',
+                    insert_data_option='INSERT_ROWS',
+                    table_range='A1'
+                )
             
             return True
             
@@ -136,7 +123,7 @@ class PPCProcessor:
 def load_credentials_from_file(uploaded_file):
     """Load Google Sheets credentials from uploaded JSON file"""
     try:
-        credentials_dict = json.load(uploaded_file)
+        credentials_dict = json.loads(uploaded_file.getvalue())
         required_fields = ['type', 'project_id', 'private_key', 'client_email']
         for field in required_fields:
             if field not in credentials_dict:
@@ -308,7 +295,11 @@ def ppc_xnurta_page():
             
             def export_to_excel(df, market):
                 output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                with pd.ExcelWriter(
+                    output,
+                    engine='xlsxwriter',
+                    engine_kwargs={'options': {'strings_to_formulas': False, 'strings_to_urls': False}}
+                ) as writer:
                     df.to_excel(writer, index=False, sheet_name='Data')
                 output.seek(0)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
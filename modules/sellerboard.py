@@ -4,9 +4,12 @@ import sys
 import re
 import asyncio
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, date
 import gspread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import io
 import json
 from typing import List, Tuple
@@ -15,15 +18,76 @@ import warnings
 import time
 import pytz
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from ._sheets_utils import data_completeness, hash_dataframe
 
 # Suppress warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 
 
+@st.cache_resource(show_spinner=False, ttl=3600)
+def get_worksheet(creds_json_str, sheet_id, worksheet_name, header=()):
+    """Return an authorized worksheet handle, reused across Streamlit reruns
+    
+    Keyed on the serialized credentials so each service account gets its own
+    client. If the worksheet does not exist it is created with `header`.
+    Handles expire after an hour, or sooner via SBProcessor._forget_worksheet.
+    """
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive"
+    ]
+    creds = Credentials.from_service_account_info(
+        json.loads(creds_json_str), scopes=scopes
+    )
+    
+    # One pooled keep-alive session for every Sheets call made through this
+    # client. Transient 429/5xx responses are retried with backoff; POST
+    # (append) is not retried by default, so rows are never sent twice.
+    session = AuthorizedSession(creds)
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    
+    client = gspread.Client(auth=creds, session=session)
+    spreadsheet = client.open_by_key(sheet_id)
+    
+    # Try to get worksheet, if not exists, create it
+    try:
+        worksheet = spreadsheet.worksheet(worksheet_name)
+    except gspread.exceptions.WorksheetNotFound:
+        worksheet = spreadsheet.add_worksheet(
+            title=worksheet_name,
+            rows="1000",
+            cols="30"
+        )
+        if header:
+            worksheet.update(values=[list(header)], range_name='A1')
+    
+    return worksheet
+
+
 class SBProcessor:
     """Sellerboard Data Processor - Optimized Version"""
     
+    # Keyword sets used to match headers that differ from the standard name
+    # (the standard 'Refund сost' is spelled with a Cyrillic 'с')
+    COLUMN_ALIASES = {
+        'Sponsored products (PPC)': (('sponsored', 'ppc'),),
+        'Refund сost': (('refund', 'cost'), ('refund', 'сost')),
+    }
+    
+    # DD_MM_YYYY date embedded in uploaded filenames
+    DATE_PATTERN = re.compile(r"(\d{2})_(\d{2})_(\d{4})")
+    
+    # Resolved header -> standard column mappings, shared by all instances
+    # since each file is parsed by its own processor
+    _column_mapping_cache = {}
+    
     def __init__(self, credentials_dict, sheet_id, market):
         self.credentials_dict = credentials_dict
         self.sheet_id = sheet_id
@@ -38,100 +102,131 @@ class SBProcessor:
             'Net profit', 'Estimated payout', 'Real ACOS', 'Sessions', 
             'VAT', 'Shipping'
         ]
+        self._standard_columns_lower = {col.lower() for col in self.standard_columns}
         
-        self.client = None
         self.spreadsheet = None
         self.worksheet = None
+        self._worksheet_args = None
         
     def _init_google_sheets(self):
         """Initialize Google Sheets connection with caching"""
         try:
-            if self.client is None:
-                scopes = [
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive"
-                ]
-                creds = Credentials.from_service_account_info(
-                    self.credentials_dict, scopes=scopes
+            if self.worksheet is None:
+                self._worksheet_args = (
+                    json.dumps(self.credentials_dict, sort_keys=True),
+                    self.sheet_id,
+                    self.worksheet_name,
+                    tuple(self.standard_columns)
                 )
-                self.client = gspread.authorize(creds)
-                self.spreadsheet = self.client.open_by_key(self.sheet_id)
-                
-                # Try to get worksheet, if not exists, create it
-                try:
-                    self.worksheet = self.spreadsheet.worksheet(self.worksheet_name)
-                except gspread.exceptions.WorksheetNotFound:
-                    self.worksheet = self.spreadsheet.add_worksheet(
-                        title=self.worksheet_name,
-                        rows="1000",
-                        cols="30"
-                    )
-                    self.worksheet.update(values=[self.standard_columns], range_name='A1')
+                self.worksheet = get_worksheet(*self._worksheet_args)
+                self.spreadsheet = self.worksheet.spreadsheet
                     
         except Exception as e:
             raise Exception(f"Error initializing Google Sheets: {e}")
     
+    def _forget_worksheet(self):
+        """Drop the cached worksheet handle so the next call looks it up again
+        
+        Called when the Sheets API rejects a request, e.g. because the tab was
+        deleted or renamed since the handle was cached.
+        """
+        if self._worksheet_args is not None:
+            get_worksheet.clear(*self._worksheet_args)
+        self.spreadsheet = None
+        self.worksheet = None
+    
     def extract_date_from_filename(self, filename):
         """Extract first DD_MM_YYYY pattern from filename"""
-        match = re.search(r"(\d{2}_\d{2}_\d{4})", filename)
+        match = self.DATE_PATTERN.search(filename)
         if match:
-            return datetime.strptime(match.group(1), "%d_%m_%Y").date()
+            day, month, year = match.groups()
+            return date(int(year), int(month), int(day))
         return None
     
+    def _is_wanted_column(self, col):
+        """Return True if a source header maps to one of the standard columns"""
+        col_lower = str(col).strip().lower()
+        if col_lower in self._standard_columns_lower:
+            return True
+        return any(
+            all(k in col_lower for k in keywords)
+            for aliases in self.COLUMN_ALIASES.values()
+            for keywords in aliases
+        )
+    
+    def _resolve_column_mapping(self, header):
+        """Map source headers to standard column names"""
+        # Exact (case-insensitive) match first, keyword aliases only on a miss
+        df_col_map = {col.lower(): col for col in header}
+        
+        column_mapping = {}
+        for std_col in self.standard_columns:
+            df_col = df_col_map.get(std_col.lower())
+            if df_col is None and std_col in self.COLUMN_ALIASES:
+                df_col = next(
+                    (
+                        col for col_lower, col in df_col_map.items()
+                        if any(all(k in col_lower for k in keywords)
+                               for keywords in self.COLUMN_ALIASES[std_col])
+                    ),
+                    None
+                )
+            if df_col is not None:
+                column_mapping[df_col] = std_col
+        return column_mapping
+    
     def _standardize_columns(self, df):
         """Standardize and select only required columns - Optimized"""
-        df = df.copy()
-        df.columns = [str(c).strip() for c in df.columns]
-        
-        # Pre-compute lowercase mappings for faster lookup
-        std_col_map = {col.lower(): col for col in self.standard_columns}
-        df_col_map = {col.lower(): col for col in df.columns}
+        df = df.set_axis([str(c).strip() for c in df.columns], axis=1)
         
-        column_mapping = {}
-        for std_col_lower, std_col in std_col_map.items():
-            if std_col_lower in df_col_map:
-                column_mapping[df_col_map[std_col_lower]] = std_col
-            elif 'sponsored' in std_col_lower and 'ppc' in std_col_lower:
-                for df_col_lower, df_col in df_col_map.items():
-                    if 'sponsored' in df_col_lower and 'ppc' in df_col_lower:
-                        column_mapping[df_col] = std_col
-                        break
-            elif 'refund' in std_col_lower and 'cost' in std_col_lower:
-                for df_col_lower, df_col in df_col_map.items():
-                    if 'refund' in df_col_lower and ('cost' in df_col_lower or 'сost' in df_col_lower):
-                        column_mapping[df_col] = std_col
-                        break
+        # Files in one batch usually share a header, so reuse its mapping
+        header = tuple(df.columns)
+        column_mapping = self._column_mapping_cache.get(header)
+        if column_mapping is None:
+            column_mapping = self._resolve_column_mapping(header)
+            self._column_mapping_cache[header] = column_mapping
         
         df = df.rename(columns=column_mapping)
-        available_columns = [col for col in self.standard_columns if col in df.columns]
-        df_filtered = df[available_columns].copy()
+        if df.columns.has_duplicates:
+            df = df.loc[:, ~df.columns.duplicated()]
+        
+        # Select, order and add missing columns in a single pass
+        return df.reindex(columns=self.standard_columns)
+    
+    def _parse_excel(self, file_content, filename):
+        """Parse and standardize a single Excel file, raising on failure"""
+        # Read with the Rust-backed calamine engine, falling back to
+        # openpyxl (pandas opens it read-only) when it is not installed.
+        # Text columns are read as str to skip dtype inference.
+        text_dtypes = {'Product': str, 'ASIN': str, 'SKU': str}
+        buffer = io.BytesIO(file_content)
+        try:
+            excel_file = pd.ExcelFile(buffer, engine='calamine')
+        except ImportError:
+            excel_file = pd.ExcelFile(buffer, engine='openpyxl')
+        
+        with excel_file:
+            # Only materialize columns that _standardize_columns keeps
+            df = excel_file.parse(0, usecols=self._is_wanted_column, dtype=text_dtypes)
         
-        # Add missing columns efficiently
-        for col in self.standard_columns:
-            if col not in df_filtered.columns:
-                df_filtered[col] = pd.NA
+        # Drop all-empty columns before mapping so a blank column named
+        # exactly like a standard column cannot shadow a filled alias column
+        df = df.dropna(axis=1, how="all")
         
-        return df_filtered[self.standard_columns]
+        date_val = self.extract_date_from_filename(filename)
+        if date_val:
+            df["Date"] = pd.to_datetime(date_val)
+        elif "Date" not in df.columns:
+            # Keep Date datetime64 in every frame so concat stays on the
+            # typed path instead of falling back to object
+            df["Date"] = pd.NaT
+
+        return self._standardize_columns(df)
     
     def process_single_excel(self, file_content, filename):
-        """Process a single Excel file - Optimized with dtype inference"""
+        """Process a single Excel file, reusing cached results for identical uploads"""
         try:
-            # Read with optimized settings
-            df = pd.read_excel(
-                io.BytesIO(file_content),
-                engine='openpyxl',
-                # Use string dtype for text columns to avoid mixed type issues
-            )
-            
-            # Drop empty columns in one go
-            df = df.dropna(axis=1, how="all")
-            
-            date_val = self.extract_date_from_filename(filename)
-            if date_val:
-                df["Date"] = pd.to_datetime(date_val)
-            
-            df = self._standardize_columns(df)
-            return df
+            return _parse_excel_cached(file_content, filename)
         except Exception as e:
             st.error(f"⚠️ Error processing {filename}: {e}")
             return pd.DataFrame()
@@ -141,19 +236,23 @@ class SBProcessor:
         all_dataframes = []
         processed_files = []
         
-        # Use ThreadPoolExecutor for parallel file processing
-        with ThreadPoolExecutor(max_workers=min(4, len(uploaded_files))) as executor:
+        if not uploaded_files:
+            return pd.DataFrame(), []
+        
+        # Use ThreadPoolExecutor for parallel file processing. File contents
+        # are read on the main thread since UploadedFile is not thread-safe;
+        # results are collected in upload order so the output is stable.
+        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
             future_to_file = {
                 executor.submit(
                     self.process_single_excel, 
-                    uploaded_file.read(), 
+                    uploaded_file.getvalue(), 
                     uploaded_file.name
                 ): uploaded_file.name 
                 for uploaded_file in uploaded_files
             }
             
-            for future in as_completed(future_to_file):
-                filename = future_to_file[future]
+            for future, filename in future_to_file.items():
                 try:
                     df = future.result()
                     if not df.empty:
@@ -165,18 +264,13 @@ class SBProcessor:
         if not all_dataframes:
             return pd.DataFrame(), []
         
-        # Filter and validate dataframes efficiently
-        valid_dataframes = []
-        for df in all_dataframes:
-            df_cleaned = df.dropna(axis=1, how="all")
-            
-            if not df_cleaned.empty and len(df_cleaned) > 0:
-                # Ensure all standard columns exist
-                for col in self.standard_columns:
-                    if col not in df_cleaned.columns:
-                        df_cleaned[col] = pd.NA
-                
-                valid_dataframes.append(df_cleaned[self.standard_columns])
+        # Frames are already non-empty and in standard column order; drop any
+        # that hold no values at all. The Date check short-circuits the common
+        # case before falling back to a full scan.
+        valid_dataframes = [
+            df for df in all_dataframes
+            if df["Date"].notna().any() or df.notna().values.any()
+        ]
         
         if not valid_dataframes:
             return pd.DataFrame(), []
@@ -184,6 +278,12 @@ class SBProcessor:
         # Concatenate all dataframes at once
         merged_df = pd.concat(valid_dataframes, ignore_index=True, sort=False)
         
+        # Repeated text columns are stored as categories to cut memory.
+        # Categorizing after concat keeps a single shared category set
+        # (concat of differing categoricals falls back to object).
+        for col in ("Product", "ASIN", "SKU"):
+            merged_df[col] = merged_df[col].astype("category")
+        
         # Sort efficiently
         if "Date" in merged_df.columns and "Sales" in merged_df.columns:
             merged_df = merged_df.sort_values(
@@ -196,16 +296,6 @@ class SBProcessor:
         
         return merged_df, processed_files
     
-    def get_existing_sheet_data_count(self):
-        """Get current number of rows in the sheet - Optimized"""
-        try:
-            # Use get_all_values with specific range for faster fetch
-            all_values = self.worksheet.col_values(1)
-            data_rows = sum(1 for val in all_values if val and val.strip()) - 1
-            return max(0, data_rows)
-        except Exception as e:
-            return 0
-    
     def delete_data_from_date(self, from_date):
         """Delete all data from specified date onwards - Optimized with batch operations"""
         try:
@@ -276,9 +366,30 @@ class SBProcessor:
             else:
                 return 0, f"No data found from {from_date.strftime('%d/%m/%Y')} onwards"
                 
+        except gspread.exceptions.APIError as e:
+            self._forget_worksheet()
+            raise Exception(f"Error deleting data: {str(e)}")
         except Exception as e:
             raise Exception(f"Error deleting data: {str(e)}")
     
+    def _append_chunk_with_retry(self, rows, max_attempts=5):
+        """Append one chunk of rows, backing off while the API rate-limits us"""
+        for attempt in range(max_attempts):
+            try:
+                # USER_ENTERED (not RAW) so the M/D/YYYY strings land as real dates
+                return self.worksheet.append_rows(
+                    rows,
+                    value_input_option="USER_ENTERED",
+                    insert_data_option="INSERT_ROWS",
+                    table_range="A1"
+                )
+            except gspread.exceptions.APIError as e:
+                # Only 429 is retried: the request was rejected before being
+                # applied, so sending it again cannot duplicate rows
+                if e.response.status_code != 429 or attempt == max_attempts - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
     def append_to_sheets(self, df, delete_from_date=None):
         """Append DataFrame to Google Sheets - Optimized with batch operations"""
         if df.empty:
@@ -293,76 +404,50 @@ class SBProcessor:
                 rows_deleted, msg = self.delete_data_from_date(delete_from_date)
                 delete_info = msg
             
-            # Get current data count after deletion
-            existing_rows = self.get_existing_sheet_data_count()
-            start_row = max(existing_rows + 2, 2)
-            end_row = start_row + len(df) - 1
-            
-            # Ensure enough rows exist
-            total_needed_rows = end_row + 1
-            current_rows = self.worksheet.row_count
-            if total_needed_rows > current_rows:
-                self.worksheet.add_rows(total_needed_rows - current_rows)
-            
-            # Prepare data efficiently using vectorized operations
-            values_to_append = []
-            
-            # Convert DataFrame to list of lists efficiently
-            for idx, row in df.iterrows():
-                row_values = []
-                for col in self.standard_columns:
-                    val = row[col]
-                    if pd.isna(val):
-                        row_values.append("")
-                    elif isinstance(val, (pd.Timestamp, datetime)):
-                        row_values.append(f"{val.month}/{val.day}/{val.year}")
-                    elif isinstance(val, (float, np.floating)):
-                        # Handle float efficiently
-                        row_values.append(float(val))
-                    elif isinstance(val, (int, np.integer)):
-                        row_values.append(int(val))
-                    else:
-                        row_values.append(str(val))
-                values_to_append.append(row_values)
-            
-            # Calculate range
-            end_col_index = len(self.standard_columns)
-            end_col_letter = gspread.utils.rowcol_to_a1(1, end_col_index).split('1')[0]
-            range_name = f"A{start_row}:{end_col_letter}{end_row}"
-            
-            # Use batch update with chunking for large datasets
-            chunk_size = 5000  # Google Sheets API limit
-            
-            if len(values_to_append) <= chunk_size:
-                # Single batch update
-                self.worksheet.update(
-                    values=values_to_append,
-                    range_name=range_name,
-                    value_input_option="USER_ENTERED"
+            # Prepare data with vectorized operations instead of per-cell checks
+            out = df[self.standard_columns].copy()
+            if 'Date' in out.columns:
+                # Each file carries a single date, so format the few distinct
+                # values once and broadcast them back by code (NaT -> -1 -> "")
+                codes, unique_dates = pd.factorize(pd.to_datetime(out['Date'], errors='coerce'))
+                labels = np.array(
+                    [f"{d.month}/{d.day}/{d.year}" for d in unique_dates] + [""],
+                    dtype=object
                 )
-            else:
-                # Chunked batch updates
-                for i in range(0, len(values_to_append), chunk_size):
-                    chunk = values_to_append[i:i + chunk_size]
-                    chunk_start_row = start_row + i
-                    chunk_end_row = chunk_start_row + len(chunk) - 1
-                    chunk_range = f"A{chunk_start_row}:{end_col_letter}{chunk_end_row}"
-                    
-                    self.worksheet.update(
-                        values=chunk,
-                        range_name=chunk_range,
-                        value_input_option="USER_ENTERED"
-                    )
-                    
-                    # Small delay to avoid rate limiting
-                    if i + chunk_size < len(values_to_append):
-                        time.sleep(0.5)
+                out['Date'] = labels[codes]
+            out = out.astype(object)
+            out = out.where(out.notna(), "")
+            values_to_append = out.values.tolist()
             
+            # Append in fixed-size chunks; the Sheets API locates the end of
+            # the table server-side, so no row count has to be fetched first
+            chunk_size = 5000  # Google Sheets API limit
+            total_rows = len(values_to_append)
+            progress_bar = st.progress(0.0) if total_rows > chunk_size else None
+
+            for i in range(0, total_rows, chunk_size):
+                chunk = values_to_append[i:i + chunk_size]
+                self._append_chunk_with_retry(chunk)
+                if progress_bar is not None:
+                    progress_bar.progress((i + len(chunk)) / total_rows)
+
+            if progress_bar is not None:
+                progress_bar.empty()
+
             return True, delete_info
             
+        except gspread.exceptions.APIError as e:
+            self._forget_worksheet()
+            raise Exception(f"Error uploading to Google Sheets: {e}")
         except Exception as e:
             raise Exception(f"Error uploading to Google Sheets: {e}")
         
+@st.cache_data(show_spinner=False, max_entries=128, ttl=3600)
+def _parse_excel_cached(file_bytes, filename):
+    """Cached SBProcessor._parse_excel keyed on the uploaded file bytes"""
+    # Parsing does not depend on the market, so it stays out of the cache key
+    return SBProcessor(None, None, None)._parse_excel(file_bytes, filename)
+
 def detect_missing_sessions_days(df: pd.DataFrame) -> List[pd.Timestamp]:
     """
     Detect days where ALL rows of that date have missing or zero Sessions
@@ -400,10 +485,25 @@ def fill_sessions_to_last_row(df: pd.DataFrame, date, total_sessions):
 
     return df
 
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: hash_dataframe})
+def export_to_excel(df: pd.DataFrame) -> bytes:
+    """Serialize DataFrame to Excel bytes, cached across reruns"""
+    output = io.BytesIO()
+    # xlsxwriter serializes much faster than openpyxl. constant_memory
+    # is not enabled: pandas writes cells column by column, which
+    # that row-streaming mode silently truncates.
+    with pd.ExcelWriter(
+        output,
+        engine='xlsxwriter',
+        engine_kwargs={'options': {'strings_to_formulas': False, 'strings_to_urls': False}}
+    ) as writer:
+        df.to_excel(writer, index=False, sheet_name='Data')
+    return output.getvalue()
+
 def load_credentials_from_file(uploaded_file):
     """Load Google Sheets credentials from uploaded JSON file"""
     try:
-        credentials_dict = json.load(uploaded_file)
+        credentials_dict = json.loads(uploaded_file.getvalue())
         
         required_fields = ['type', 'project_id', 'private_key', 'client_email']
         for field in required_fields:
@@ -541,7 +641,11 @@ def sellerboard_page():
                         if asin_col:
                             before_rows = len(result_df)
 
-                            result_df[asin_col] = result_df[asin_col].astype(str).str.upper()
+                            # Upper-case through the categories rather than
+                            # every row, so ASIN stays categorical
+                            result_df[asin_col] = result_df[asin_col].map(
+                                lambda v: str(v).upper(), na_action='ignore'
+                            ).astype("category")
 
                             result_df = result_df[
                                 result_df[asin_col].isin(asin_list)
@@ -563,6 +667,7 @@ def sellerboard_page():
                     processing_time = time.time() - start_time
                     
                     st.session_state.result_df = result_df
+                    st.session_state.result_completeness = data_completeness(result_df)
                     st.session_state.processor = processor
                     st.session_state.processed_files = processed_files
                     st.session_state.last_processed_files = current_file_names
@@ -574,7 +679,7 @@ def sellerboard_page():
                         
                 except Exception as e:
                     st.error(f"❌ Error processing files: {str(e)}")
-                    for key in ['result_df', 'processor', 'processed_files', 'last_processed_files']:
+                    for key in ['result_df', 'result_completeness', 'processor', 'processed_files', 'last_processed_files']:
                         if key in st.session_state:
                             del st.session_state[key]
         
@@ -592,7 +697,11 @@ def sellerboard_page():
             with col3:
                 st.metric("📁 Files", len(processed_files))
             with col4:
-                completeness = (1 - result_df.isnull().sum().sum() / (len(result_df) * len(result_df.columns))) * 100
+                # Computed once when the frame is stored, not on every rerun
+                completeness = st.session_state.get('result_completeness')
+                if completeness is None:
+                    completeness = data_completeness(result_df)
+                    st.session_state.result_completeness = completeness
                 st.metric("✓ Completeness", f"{completeness:.1f}%")
             
             # Preview
@@ -638,33 +747,31 @@ def sellerboard_page():
                     )
 
                 if st.button("✅ Apply Sessions Data", use_container_width=True):
-                    updated_df = result_df.copy()
+                    # fill_sessions_to_last_row copies, so no up-front copy needed
+                    updated_df = result_df
 
                     for d, val in session_inputs.items():
                         if val > 0:
                             updated_df = fill_sessions_to_last_row(updated_df, d, val)
 
+                    # Keep the export/upload below in sync without another rerun
                     st.session_state.result_df = updated_df
+                    st.session_state.result_completeness = data_completeness(updated_df)
+                    result_df = updated_df
 
                     st.success("🎯 Sessions data has been successfully updated!")
 
             # Export section
             st.markdown("### 📤 Export Options")
             
-            def export_to_excel(df, market):
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Data')
-                output.seek(0)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                return output, f"SB_{market}_{timestamp}.xlsx"
-            
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("#### 📥 Download Locally")
                 
-                excel_data, filename = export_to_excel(result_df, selected_market)
+                excel_data = export_to_excel(result_df)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"SB_{selected_market}_{timestamp}.xlsx"
                 st.download_button(
                     label="💾 Download Excel",
                     data=excel_data,
@@ -701,10 +808,10 @@ def sellerboard_page():
                     if enable_delete:
                         # Get min and max dates from uploaded data for reference
                         if 'Date' in result_df.columns:
-                            result_df_temp = result_df.copy()
-                            result_df_temp['Date'] = pd.to_datetime(result_df_temp['Date'])
-                            min_date = result_df_temp['Date'].min().date()
-                            max_date = result_df_temp['Date'].max().date()
+                            # Convert just the Date column rather than copying the frame
+                            dates = pd.to_datetime(result_df['Date'])
+                            min_date = dates.min().date()
+                            max_date = dates.max().date()
                             
                             st.info(f"📅 Your uploaded data range: {min_date.strftime('%d/%m/%Y')} to {max_date.strftime('%d/%m/%Y')}")
                         